@@ -1,13 +1,23 @@
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-import requests
-from bs4 import BeautifulSoup, Tag, NavigableString
+import httpx
+import orjson
+from lxml import etree
 import asyncio
+import concurrent.futures
+import dataclasses
 import datetime
+import functools
+import hashlib
+import io
 import logging
 import os
+import pathlib
+import random
+import re
 
 URL = "https://en.wikipedia.org/wiki/List_of_current_world_boxing_champions"
 HEADERS = {
@@ -17,11 +27,16 @@ HEADERS = {
         "Chrome/120.0.0.0 Safari/537.36"
     ),
     "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate",
 }
+_WIKI_BASE = "https://en.wikipedia.org"
+_EDIT = "[edit]"
+_CHAMPION_SUFFIX = " champion"
 
 app = FastAPI(title="World Boxing Champions",
               description="Scrapes Wikipedia's 'List of current world boxing champions' and exposes champions per organization and weight class.",
               version="1.0")
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 # Config: how many days to consider a champion "new" (can be set via env NEW_FLAG_DAYS)
 try:
@@ -32,82 +47,213 @@ except Exception:
     logging.warning("Invalid NEW_FLAG_DAYS env var %r; falling back to 14", os.getenv("NEW_FLAG_DAYS"))
     NEW_FLAG_DAYS = 14
 
+# Warm-start cache of the last parsed champions (can be set via env CACHE_FILE)
+CACHE_FILE = pathlib.Path(os.getenv("CACHE_FILE", "cache/champions.json"))
+_CACHE_META_FILE = CACHE_FILE.with_suffix(".meta.json")
+
 # Mount static files and templates for the UI
 templates = Jinja2Templates(directory="templates")
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 
-def fetch_page():
-    resp = requests.get(URL, headers=HEADERS)
+async def fetch_page():
+    """Fetch the Wikipedia page, revalidating against the last successful fetch.
+
+    Returns the response, or None if Wikipedia replied 304 Not Modified.
+    """
+    headers = {}
+    # The "recent" flags depend on the current date, so only revalidate a page
+    # parsed today; once the day rolls over fetch it in full to re-parse it.
+    if getattr(app.state, "parsed_on", None) == _utc_today():
+        etag = getattr(app.state, "page_etag", None)
+        last_modified = getattr(app.state, "page_last_modified", None)
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    resp = await app.state.http.get(URL, headers=headers)
+    if resp.status_code == 304:
+        return None
     resp.raise_for_status()
-    return resp.text
+    return resp
 
 
-def parse_champions(html: str):
-    soup = BeautifulSoup(html, "html.parser")
+def _utc_today():
+    return datetime.datetime.now(datetime.timezone.utc).date()
+
+
+def _texts(el):
+    """Return the stripped, non-empty text nodes under `el` in document order.
+
+    Mirrors BeautifulSoup's `get_text(strip=True)`: comments and the contents
+    of <style>/<script> elements are skipped.
+    """
+    return [t.strip() for t in el.xpath(".//text()[not(ancestor::style or ancestor::script)]") if t.strip()]
 
-    results = []
 
-    tables = soup.find_all("table", class_="wikitable")
+@dataclasses.dataclass(slots=True)
+class Champ:
+    """A title holder, or a vacancy, for one organization in a division."""
+    name: str | None = None
+    record: str | None = None
+    title: str | None = None
+    date: str | None = None
+    recent: bool | None = None
+    wikiUrl: str | None = None
+    type: str | None = None
 
-    for table in tables:
-        title_tag = table.find_previous(["h2", "h3"])
-        weight_class = title_tag.get_text().replace("[edit]", "").strip()
+    # Left out of the JSON when unset: only vacancies have a title, and only
+    # named champions have recent/type.
+    _OPTIONAL_FIELDS = ("title", "recent", "type")
+
+    def to_json(self):
+        """Return the dict shape exposed by the /champions endpoint."""
+        return {
+            field.name: getattr(self, field.name)
+            for field in dataclasses.fields(self)
+            if field.name not in self._OPTIONAL_FIELDS or getattr(self, field.name) is not None
+        }
+
+
+def _json_default(obj):
+    if isinstance(obj, Champ):
+        return obj.to_json()
+    raise TypeError
+
+
+def _walk_cell(cell):
+    """Walk `cell` once, collecting its text and first link in a single pass.
+
+    Returns `(texts, a, name)`: the stripped, non-empty text nodes (as `_texts`
+    would), the first <a> element or None, and the joined text inside that link.
+    """
+    texts = []
+    a = None
+    a_start = a_end = 0
+    # Comments and processing instructions are reported as their own events:
+    # their text isn't content but their tail is.
+    for event, el in etree.iterwalk(cell, events=("start", "end", "comment", "pi")):
+        if event == "start":
+            if a is None and el.tag == "a":
+                a = el
+                a_start = len(texts)
+            if el.text and el.tag not in ("style", "script"):
+                text = el.text.strip()
+                if text:
+                    texts.append(text)
+        else:
+            if el is a:
+                a_end = len(texts)
+            if el is not cell and el.tail:
+                text = el.tail.strip()
+                if text:
+                    texts.append(text)
+    name = "".join(texts[a_start:a_end]) if a is not None else None
+    return texts, a, name
+
+
+def _next_sibling_text(el):
+    """Return the first non-empty text node following `el` among its siblings."""
+    if el.tail:
+        return el.tail
+    for sibling in el.itersiblings():
+        if sibling.tail:
+            return sibling.tail
+    return None
+
+
+def _is_wikitable(el):
+    return el.tag == "table" and "wikitable" in (el.get("class") or "").split()
+
+
+def _iter_sections(html: str):
+    """Yield the <h2>/<h3> headings and wikitables of `html` in document order.
+
+    The page is parsed incrementally; each yielded element, and everything
+    before it at its level, is freed once the caller moves on so the rest of
+    the page (navigation, references, ...) isn't kept around as one big tree.
+    Nothing inside a wikitable is touched until the table itself is yielded.
+    """
+    source = io.BytesIO(html.encode("utf-8"))
+    open_wikitables = 0
+    events = etree.iterparse(source, events=("start", "end"), tag=("h2", "h3", "table"),
+                             html=True, encoding="utf-8")
+    for event, el in events:
+        is_wikitable = _is_wikitable(el)
+        if event == "start":
+            open_wikitables += is_wikitable
+            continue
+        open_wikitables -= is_wikitable
+        if open_wikitables:
+            # Still inside a wikitable; it's yielded (and freed) as a whole later
+            continue
+
+        if is_wikitable:
+            yield el
+            # Headings and wikitables nested inside follow it in document order
+            for inner in el.iter("h2", "h3", "table"):
+                if inner is not el and (inner.tag != "table" or _is_wikitable(inner)):
+                    yield inner
+        elif el.tag != "table":
+            yield el
+        el.clear(keep_tail=True)
+        while el.getprevious() is not None:
+            del el.getparent()[0]
+
+
+def parse_champions(html: str):
+    results = []
+    results_append = results.append
+    today = _utc_today()
+
+    # Headings and wikitables in document order, so each table's title is the
+    # most recent heading seen rather than a backwards scan per table.
+    weight_class = None
+    for node in _iter_sections(html):
+        if node.tag != "table":
+            # Read the heading now: it is cleared once the next node is requested
+            weight_class = "".join(node.itertext()).replace(_EDIT, "").strip()
+            continue
+        table = node
 
         division, weight = weight_class.split(" (")
         weight = weight.rstrip(")") 
 
-        headers = [th.get_text(strip=True) for th in table.find_all("th")]
-        rows = []
-        orgs = []
-        more_champs = []
-        os = table.find_all("tr")[0]
-        for org in os.find_all("td"):
-            orgs.append(org.get_text(strip=True).lower())
+        # Walk the rows lazily: the first row names the organizations, the rest hold champions
+        tr_iter = table.iter("tr")
+        header_tr = next(tr_iter)
+        orgs = ["".join(_texts(org)).lower() for org in header_tr.iter("td")]
 
         champs = {}
 
-        # Track pending rowspans per organization column. Each entry is either
-        # None or a dict: {"remaining": int, "champ": dict}
-        pending_rowspans = [None] * len(orgs)
+        # Track pending rowspans per organization column: the number of
+        # following rows still covered by the cell already recorded.
+        pending_rowspans = [0] * len(orgs)
 
-        for row in table.find_all("tr")[1:]:
-            cells_iter = iter(row.find_all(["td", "th"]))
+        for row in tr_iter:
+            cells_iter = row.iter("td", "th")
 
             for col_idx, organization in enumerate(orgs):
                 # If there's a pending rowspan for this column, skip consuming a
                 # cell on this row. We already recorded the champ when we saw
                 # the original cell; don't re-append it on subsequent rows.
-                if pending_rowspans[col_idx]:
-                    pending_rowspans[col_idx]["remaining"] -= 1
-                    if pending_rowspans[col_idx]["remaining"] <= 0:
-                        pending_rowspans[col_idx] = None
+                if pending_rowspans[col_idx] > 0:
+                    pending_rowspans[col_idx] -= 1
                     continue
 
                 # Otherwise consume the next cell (if any)
                 cell = next(cells_iter, None)
                 if cell is None:
                     # No cell present and no pending rowspan -> Vacant
-                    champs.setdefault(organization, []).append({
-                        "name": None,
-                        "record": None,
-                        "title": "Vacant",
-                        "date": None,
-                        "wikiUrl": None,
-                    })
+                    champs.setdefault(organization, []).append(Champ(title="Vacant"))
                     continue
 
                 rowspan = cell.get("rowspan")
 
-                a = cell.find("a")
-                if not a:
-                        vacant = {
-                            "name": None,
-                            "record": None,
-                            "title": "Vacant",
-                            "date": None,
-                            "wikiUrl": None,
-                        }
+                cell_texts, a, name = _walk_cell(cell)
+                if a is None:
+                        vacant = Champ(title="Vacant")
                         champs.setdefault(organization, []).append(vacant)
                         # If this cell spans multiple rows, carry the vacant forward
                         try:
@@ -115,56 +261,52 @@ def parse_champions(html: str):
                         except Exception:
                             span = 1
                         if span > 1:
-                            pending_rowspans[col_idx] = {"remaining": span - 1, "champ": vacant.copy()}
+                            pending_rowspans[col_idx] = span - 1
                         continue
 
                 href = a.get("href")
-                name = a.get_text(strip=True)
-                record = a.find_next_sibling(string=True)
+                record = _next_sibling_text(a)
 
-                texts = cell.get_text(separator="\n", strip=True).split("\n")
+                texts = "\n".join(cell_texts).split("\n")
 
                 title = texts[1] if len(texts) > 1 else None
                 if title == record:
                     title = None
 
-                date = texts[2] if len(texts) > 2 else None
-                if len(texts) > 3:
-                    date = texts[3]
+                date = texts[3] if len(texts) > 3 else texts[2] if len(texts) > 2 else None
 
-                champ = {
-                    "name": name,
-                    "record": record,
-                    "date": date,
-                    "recent": False,
-                    "wikiUrl": "https://en.wikipedia.org" + href,
-                }
+                champ = Champ(
+                    name=name,
+                    record=record,
+                    date=date,
+                    recent=False,
+                    wikiUrl=_WIKI_BASE + href,
+                )
 
                 try:
                     parsed = _try_parse_date(date)
                     if parsed:
-                        today = datetime.datetime.now(datetime.timezone.utc).date()
                         delta = (today - parsed).days
                         if 0 <= delta <= NEW_FLAG_DAYS:
-                            champ["recent"] = True
+                            champ.recent = True
                 except Exception:
                     pass
 
                 if title:
-                    champ["type"] = title.replace(" champion", "")
+                    champ.type = title.replace(_CHAMPION_SUFFIX, "")
 
-                # If the cell spans multiple rows, remember its champ for next rows
+                # If the cell spans multiple rows, skip this column on the next rows
                 try:
                     span = int(rowspan) if rowspan is not None else 1
                 except Exception:
                     span = 1
 
                 if span > 1:
-                    pending_rowspans[col_idx] = {"remaining": span - 1, "champ": champ.copy()}
+                    pending_rowspans[col_idx] = span - 1
 
                 champs.setdefault(organization, []).append(champ)
 
-        results.append ({
+        results_append({
             "name": division,
             "weight": weight,
             **champs
@@ -172,6 +314,19 @@ def parse_champions(html: str):
     return results
 
 
+_ORDINAL_RE = re.compile(r"(\d+)(st|nd|rd|th)")
+# Wikipedia's canonical "December 6, 2025" shape
+_DATE_RE = re.compile(r"([A-Za-z]+)\s+(\d{1,2}),\s*(\d{4})")
+_MONTHS = {
+    name.lower(): number
+    for number, full in enumerate(
+        ("January", "February", "March", "April", "May", "June", "July",
+         "August", "September", "October", "November", "December"), start=1)
+    for name in (full, full[:3])
+}
+
+
+@functools.lru_cache(maxsize=1024)
 def _try_parse_date(date_str: str):
     """Try to parse a variety of common date formats into a datetime.date.
 
@@ -182,8 +337,17 @@ def _try_parse_date(date_str: str):
 
     # Trim parenthetical annotations and whitespace, and remove ordinals.
     s = date_str.split("(")[0].strip()
-    import re
-    s = re.sub(r"(\d+)(st|nd|rd|th)", r"\1", s)
+    s = _ORDINAL_RE.sub(r"\1", s)
+
+    # Fast path: build the date from a month lookup rather than strptime
+    match = _DATE_RE.fullmatch(s)
+    if match:
+        month = _MONTHS.get(match.group(1).lower())
+        if month:
+            try:
+                return datetime.date(int(match.group(3)), month, int(match.group(2)))
+            except ValueError:
+                return None
 
     try:
         # Expect format like: "December 6, 2025"
@@ -194,54 +358,219 @@ def _try_parse_date(date_str: str):
 
 @app.get("/")
 async def root(request: Request):
-    """Render the web UI showing champions by weight division using cached data."""
+    """Serve the web UI showing champions by weight division, pre-rendered at refresh time."""
     data = getattr(app.state, "champions_data", None)
     if not data:
         # Data not yet fetched
         raise HTTPException(status_code=503, detail="Champion data not ready. Try again shortly.")
-    return templates.TemplateResponse("index.html", {"request": request, "divisions": data})
+    headers = {"Cache-Control": "public, max-age=600", "ETag": app.state.index_etag}
+    if app.state.champions_modified:
+        headers["Last-Modified"] = app.state.champions_modified.strftime("%a, %d %b %Y %H:%M:%S GMT")
+    if _etag_matches(request, app.state.index_etag):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=app.state.index_html, headers=headers)
 
 @app.get("/champions")
-async def champions():
-    data = getattr(app.state, "champions_data", None)
-    if data is None:
+async def champions(request: Request):
+    """Serve the champions JSON, pre-serialized at refresh time."""
+    body = getattr(app.state, "champions_json", None)
+    if body is None:
         raise HTTPException(status_code=503, detail="Champion data not ready. Try again shortly.")
-    return JSONResponse(content=data)
+    headers = {"Cache-Control": "public, max-age=3600", "ETag": app.state.champions_etag}
+    if _etag_matches(request, app.state.champions_etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _etag_matches(request: Request, etag: str):
+    """Return True if the request's If-None-Match lists `etag`."""
+    if_none_match = request.headers.get("if-none-match", "")
+    return etag in (tag.strip() for tag in if_none_match.split(","))
 
 
-async def _refresh_loop(interval_seconds: int = 8 * 3600):
+def _set_champions(data, modified=None):
+    """Store freshly parsed champions along with their serialized JSON, rendered page and ETags.
+
+    `modified` is when the content last changed; by default it's now, unless
+    the JSON and page are identical to what is already cached.
+    """
+    body = orjson.dumps(data, default=_json_default, option=orjson.OPT_PASSTHROUGH_DATACLASS)
+    # The page doesn't depend on the request, so render it once per refresh
+    page = templates.get_template("index.html").render(divisions=data).encode("utf-8")
+    # Weak, since GZipMiddleware may change the bytes on the wire
+    champions_etag = 'W/"%s"' % hashlib.md5(body).hexdigest()
+    index_etag = 'W/"%s"' % hashlib.md5(page).hexdigest()
+    if modified is None:
+        unchanged = (champions_etag == getattr(app.state, "champions_etag", None)
+                     and index_etag == getattr(app.state, "index_etag", None))
+        modified = app.state.champions_modified if unchanged else datetime.datetime.utcnow()
+    app.state.champions_data = data
+    app.state.champions_json = body
+    app.state.index_html = page
+    app.state.champions_etag = champions_etag
+    app.state.index_etag = index_etag
+    app.state.champions_modified = modified
+
+
+def _save_cache():
+    """Write the cached champions and page validators to disk for the next start."""
+    meta = {
+        "last_updated": app.state.last_updated.isoformat(),
+        "champions_modified": app.state.champions_modified.isoformat(),
+        "page_etag": app.state.page_etag,
+        "page_last_modified": app.state.page_last_modified,
+        "page_hash": app.state.page_hash,
+        "parsed_on": app.state.parsed_on.isoformat() if app.state.parsed_on else None,
+    }
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    for path, content in ((CACHE_FILE, app.state.champions_json), (_CACHE_META_FILE, orjson.dumps(meta))):
+        # Write then rename so a crash never leaves a truncated file behind
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(content)
+        tmp.replace(path)
+
+
+def _load_cache():
+    """Populate the cache from disk, if present. Returns True if data was loaded."""
+    if not CACHE_FILE.exists():
+        return False
+    # Parse everything before touching app.state so a bad file installs nothing
+    data = orjson.loads(CACHE_FILE.read_bytes())
+    meta = orjson.loads(_CACHE_META_FILE.read_bytes()) if _CACHE_META_FILE.exists() else {}
+    last_updated = meta.get("last_updated")
+    last_updated = datetime.datetime.fromisoformat(last_updated) if last_updated else None
+    modified = meta.get("champions_modified")
+    modified = datetime.datetime.fromisoformat(modified) if modified else None
+    # Without a parse date the "recent" flags can't be trusted, so leave
+    # parsed_on unset and the first fetch will re-parse.
+    parsed_on = meta.get("parsed_on")
+    parsed_on = datetime.date.fromisoformat(parsed_on) if parsed_on else None
+
+    _set_champions(data, modified=modified)
+    app.state.last_updated = last_updated
+    app.state.page_etag = meta.get("page_etag")
+    app.state.page_last_modified = meta.get("page_last_modified")
+    app.state.page_hash = meta.get("page_hash")
+    app.state.parsed_on = parsed_on
+    return True
+
+
+async def _refresh_cache():
+    """Fetch the page and re-parse it if it changed since the last refresh.
+
+    The fetch is awaited on the shared HTTP client; the CPU-bound parse runs in
+    a worker process so it doesn't hold the GIL while requests are being served.
+    Returns True if the cached champions were replaced, False if the page was unchanged.
+    A page that hasn't changed is still re-parsed once per UTC day, since the
+    "recent" flags are computed against the parse date.
+    """
+    resp = await fetch_page()
+    changed = False
+    if resp is not None:
+        # Not every response is a 304 even when the content is identical, so
+        # compare the body hash before paying for a parse.
+        page_hash = hashlib.sha1(resp.content).hexdigest()
+        today = _utc_today()
+        if (page_hash != app.state.page_hash or app.state.parsed_on != today
+                or app.state.champions_data is None):
+            loop = asyncio.get_running_loop()
+            data = await loop.run_in_executor(app.state.parse_pool, parse_champions, resp.text)
+            _set_champions(data)
+            app.state.page_hash = page_hash
+            app.state.parsed_on = today
+            changed = True
+        # Only remember validators once the page has been parsed successfully
+        app.state.page_etag = resp.headers.get("ETag")
+        app.state.page_last_modified = resp.headers.get("Last-Modified")
+    app.state.last_updated = datetime.datetime.utcnow()
+    if resp is not None:
+        try:
+            await asyncio.to_thread(_save_cache)
+        except Exception:
+            logging.exception("Failed to write champions cache file %s", CACHE_FILE)
+    return changed
+
+
+async def _refresh_loop(interval_seconds: int = 8 * 3600, jitter_seconds: int = 600,
+                        max_backoff_seconds: int = 1800, refresh_now: bool = True):
     """Background loop that refreshes the cached champions every `interval_seconds`.
 
-    Uses `asyncio.to_thread` to run blocking network and parse work in a threadpool.
+    The interval is jittered by up to `jitter_seconds` so replicas don't all hit
+    Wikipedia at once. Failures are retried with exponential backoff (starting
+    at a minute, capped at `max_backoff_seconds`) rather than waiting a full interval.
+    With `refresh_now` false the first refresh waits for an interval too.
     """
+    attempt = 0
+    delay = 0 if refresh_now else interval_seconds + random.uniform(-jitter_seconds, jitter_seconds)
     while True:
+        await asyncio.sleep(delay)
         try:
-            html = await asyncio.to_thread(fetch_page)
-            data = await asyncio.to_thread(parse_champions, html)
-            app.state.champions_data = data
-            app.state.last_updated = datetime.datetime.utcnow()
-            logging.info("Champions cache refreshed at %s", app.state.last_updated)
+            if await _refresh_cache():
+                logging.info("Champions cache refreshed at %s", app.state.last_updated)
+            else:
+                logging.info("Champions page unchanged at %s; keeping cached data", app.state.last_updated)
+            attempt = 0
+            delay = interval_seconds + random.uniform(-jitter_seconds, jitter_seconds)
         except Exception:
-            logging.exception("Failed to refresh champions cache")
-        await asyncio.sleep(interval_seconds)
+            delay = min(60 * 2 ** attempt, max_backoff_seconds) + random.uniform(0, 30)
+            attempt += 1
+            logging.exception("Failed to refresh champions cache; retrying in %.0fs", delay)
 
 
 @app.on_event("startup")
 async def _startup_fetch_and_schedule():
-    """Fetch immediately on startup and start the periodic refresh task."""
+    """Load the warm-start cache (or fetch, if there is none) and start the periodic refresh task."""
     # initialize state
     app.state.champions_data = None
+    app.state.champions_json = None
+    app.state.champions_etag = None
+    app.state.index_html = None
+    app.state.index_etag = None
+    app.state.champions_modified = None
     app.state.last_updated = None
+    app.state.page_etag = None
+    app.state.page_last_modified = None
+    app.state.page_hash = None
+    app.state.parsed_on = None
+    app.state.parse_pool = concurrent.futures.ProcessPoolExecutor(max_workers=1)
+    # Shared client so the keep-alive connection (and TLS session) is reused between refreshes
+    app.state.http = httpx.AsyncClient(
+        headers=HEADERS,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=3,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=2),
+        ),
+    )
+
+    # Serve the last known data straight away and let the refresh task
+    # revalidate it (re-parsing it if it was parsed on an earlier day), so
+    # startup doesn't wait on Wikipedia.
+    try:
+        if _load_cache():
+            logging.info("Loaded champions cache from %s", CACHE_FILE)
+            app.state.refresh_task = asyncio.create_task(_refresh_loop())
+            return
+    except Exception:
+        logging.exception("Failed to load champions cache file %s", CACHE_FILE)
 
-    # initial fetch (run in thread)
+    # cold start: initial fetch
+    fetched = False
     try:
-        html = await asyncio.to_thread(fetch_page)
-        data = await asyncio.to_thread(parse_champions, html)
-        app.state.champions_data = data
-        app.state.last_updated = datetime.datetime.utcnow()
+        await _refresh_cache()
+        fetched = True
         logging.info("Initial champions cache populated at %s", app.state.last_updated)
     except Exception:
         logging.exception("Initial champions fetch failed; cache remains empty")
 
-    # start background refresh task
-    asyncio.create_task(_refresh_loop())
+    # start background refresh task; after a successful fetch it waits a full interval
+    app.state.refresh_task = asyncio.create_task(_refresh_loop(refresh_now=not fetched))
+
+
+@app.on_event("shutdown")
+async def _shutdown_workers():
+    """Stop the refresh task, close the HTTP client and stop the parse worker."""
+    app.state.refresh_task.cancel()
+    await app.state.http.aclose()
+    app.state.parse_pool.shutdown(cancel_futures=True)